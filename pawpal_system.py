@@ -1,20 +1,134 @@
+import heapq
+import math
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Optional, Tuple
 from datetime import datetime, date, timedelta
-from enum import Enum
+from enum import IntEnum
+from operator import attrgetter
 
 
-class Frequency(Enum):
-    """Task frequency options."""
-    DAILY = "daily"
-    WEEKLY = "weekly"
-    MONTHLY = "monthly"
-    AS_NEEDED = "as_needed"
+class Frequency(IntEnum):
+    """Task frequency options. Values double as indexes into _DUE_HANDLERS."""
+    DAILY = 0
+    WEEKLY = 1
+    MONTHLY = 2
+    AS_NEEDED = 3
 
 
-@dataclass
+# Due-today rules per frequency; each takes (last_completed, today)
+def _due_daily(last_completed: Optional[date], today: date) -> bool:
+    return last_completed != today
+
+
+def _due_weekly(last_completed: Optional[date], today: date) -> bool:
+    return last_completed is None or today.toordinal() - last_completed.toordinal() >= 7
+
+
+def _due_monthly(last_completed: Optional[date], today: date) -> bool:
+    return (last_completed is None or today.month != last_completed.month
+            or today.year != last_completed.year)
+
+
+def _due_as_needed(last_completed: Optional[date], today: date) -> bool:
+    return True
+
+
+# Indexed by Frequency value
+_DUE_HANDLERS = (_due_daily, _due_weekly, _due_monthly, _due_as_needed)
+
+# Frequencies that auto-generate a next instance on completion, and how far ahead it falls
+_RECURRENCE_INTERVALS = {Frequency.DAILY: timedelta(days=1), Frequency.WEEKLY: timedelta(weeks=1)}
+
+
+# Sort key for tasks without a usable HH:MM time; sorts after every real time
+_NO_TIME = 2**31 - 1
+
+
+def _parse_hhmm(time_str: Optional[str]) -> int:
+    """Convert HH:MM format to minutes since midnight, or _NO_TIME if missing, unparseable or out of range."""
+    if not time_str:
+        return _NO_TIME
+    try:
+        # Fast path for the canonical "HH:MM" form: digit arithmetic, no split() or int()
+        if len(time_str) == 5 and time_str[2] == ':':
+            h1 = ord(time_str[0]) - 48
+            h2 = ord(time_str[1]) - 48
+            m1 = ord(time_str[3]) - 48
+            m2 = ord(time_str[4]) - 48
+            if 0 <= h1 <= 9 and 0 <= h2 <= 9 and 0 <= m1 <= 9 and 0 <= m2 <= 9:
+                hours = h1 * 10 + h2
+                minutes = m1 * 10 + m2
+                return hours * 60 + minutes if hours < 24 and minutes < 60 else _NO_TIME
+        # General form, e.g. "9:30"
+        hours, minutes = map(int, time_str.split(':'))
+        return hours * 60 + minutes if 0 <= hours < 24 and 0 <= minutes < 60 else _NO_TIME
+    except (ValueError, AttributeError, TypeError):
+        return _NO_TIME
+
+
+def _knapsack(weights: List[int], values: List[int], capacity: int) -> List[bool]:
+    """
+    Solve a 0/1 knapsack over integer weights and return which items to take.
+    Later items only replace earlier choices on a strict improvement, so ties favour earlier items.
+    """
+    # best[c] = highest total value achievable within capacity c, for c up to the current reach
+    best = [0]
+    take = []  # take[i][c] == 1 if item i improved best[c]; row i only covers c <= reaches[i]
+    reaches = []  # reaches[i] = capacity reachable by items 0..i; best is flat above it
+    reach = 0
+    for weight, value in zip(weights, values):
+        # Only capacities up to the combined weight so far can change; grow best by its flat tail first
+        new_reach = min(capacity, reach + weight)
+        best.extend([best[reach]] * (new_reach - reach))
+        reach = new_reach
+        row = bytearray(reach + 1)
+        if weight <= reach:
+            # Iterate over a snapshot of the previous row so each item is used at most once
+            for c, previous in enumerate(best[:reach + 1 - weight], weight):
+                candidate = previous + value
+                if candidate > best[c]:
+                    best[c] = candidate
+                    row[c] = 1
+        take.append(row)
+        reaches.append(reach)
+    
+    # Walk back through the items to recover the chosen set
+    selected = [False] * len(weights)
+    c = capacity
+    for i in range(len(weights) - 1, -1, -1):
+        c = min(c, reaches[i])
+        if take[i][c]:
+            selected[i] = True
+            c -= weights[i]
+    return selected
+
+
+# Knapsack units per minute when any duration is fractional: hundredths of a minute
+_FRACTIONAL_SCALE = 100
+
+
+# Sort key ordering tasks by parsed time (untimed tasks last); goes through the Task.time_minutes property
+_time_key = attrgetter('time_minutes')
+
+
+# Shared "today" token: the version only changes when the date rolls over, so
+# cached due-today verdicts stay valid across repeated plan regenerations.
+_TODAY_CACHE = {"date": None, "version": 0}
+
+
+def _refresh_today() -> int:
+    """Refresh the shared today token and return its current version."""
+    today = date.today()
+    if today != _TODAY_CACHE["date"]:
+        _TODAY_CACHE["date"] = today
+        _TODAY_CACHE["version"] += 1
+    return _TODAY_CACHE["version"]
+
+
+@dataclass(slots=True, eq=False)
 class Task:
-    """Represents a task for a pet."""
+    """Represents a task for a pet. Each task is a distinct instance; tasks compare and hash by identity."""
     name: str
     duration: float  # in minutes
     priority: int  # 1-5, where 5 is highest
@@ -23,42 +137,88 @@ class Task:
     completed: bool = False
     last_completed: date = None
     time: str = None  # scheduled time in HH:MM format (e.g., "09:30")
+    # minutes since midnight parsed from time, and the time object they were parsed from
+    _time_minutes: int = field(init=False, default=_NO_TIME, repr=False, compare=False)
+    _time_parsed: Optional[str] = field(init=False, default=None, repr=False, compare=False)
+    # (today version, last_completed, frequency, verdict) from the last due-today check
+    _due_cache: tuple = field(default=(-1, None, None, False), init=False, repr=False, compare=False)
     
-    def isDueToday(self) -> bool:
-        """Check if the task is due today based on frequency."""
-        today = date.today()
+    def __post_init__(self):
+        self._time_minutes = _parse_hhmm(self.time)
+        self._time_parsed = self.time
+        # Task types repeat across many tasks; interning shares one string and lets == short-circuit on identity
+        if isinstance(self.taskType, str):
+            self.taskType = sys.intern(self.taskType)
+    
+    @property
+    def time_minutes(self) -> int:
+        """Minutes since midnight for time (_NO_TIME if unset or invalid), re-parsed after time is reassigned."""
+        if self.time is not self._time_parsed:
+            self._time_minutes = _parse_hhmm(self.time)
+            self._time_parsed = self.time
+        return self._time_minutes
+    
+    def isDueToday(self, today: Optional[date] = None) -> bool:
+        """
+        Check if the task is due today based on frequency.
         
-        if self.frequency == Frequency.DAILY:
-            return self.last_completed != today
-        elif self.frequency == Frequency.WEEKLY:
-            return self.last_completed is None or (today - self.last_completed).days >= 7
-        elif self.frequency == Frequency.MONTHLY:
-            return self.last_completed is None or (today.month != self.last_completed.month)
-        else:  # AS_NEEDED
-            return True
-    
-    def mark_complete(self) -> Optional['Task']:
+        Args:
+            today: The date to check against. Callers looping over many tasks can look it up once
+                and pass it in to skip the per-call clock read. Defaults to date.today().
+        """
+        if today is None:
+            _refresh_today()
+        elif today != _TODAY_CACHE["date"]:
+            return self._compute_due(today)
+        return self._is_due_cached()
+    
+    def _is_due_cached(self) -> bool:
         """
-        Mark the task as complete and return a new task instance for the next occurrence.
+        Return the due-today verdict, reusing the cached one while the today token,
+        last completion date and frequency are unchanged. Assumes the token is fresh.
+        """
+        version, last_completed, frequency, due = self._due_cache
+        if (version == _TODAY_CACHE["version"] and last_completed is self.last_completed
+                and frequency is self.frequency):
+            return due
+        due = self._compute_due(_TODAY_CACHE["date"])
+        self._due_cache = (_TODAY_CACHE["version"], self.last_completed, self.frequency, due)
+        return due
+    
+    def _compute_due(self, today: date) -> bool:
+        """Evaluate the frequency rules against the given date."""
+        return _DUE_HANDLERS[self.frequency](self.last_completed, today)
+    
+    def mark_complete(self, reuse: bool = False) -> Optional['Task']:
+        """
+        Mark the task as complete and return a task instance for the next occurrence.
         For daily/weekly tasks, creates a new instance with the next due date.
         For as_needed/monthly tasks, just marks as complete without creating a new instance.
         
+        Args:
+            reuse: For daily/weekly tasks, record today's completion on this task and return
+                it as its own next occurrence instead of allocating a new Task. The task stays
+                incomplete and becomes due again once its frequency interval has passed.
+        
         Returns:
-            A new Task instance for the next occurrence (or None for as_needed/monthly tasks).
+            The Task for the next occurrence (a new instance, or this task when reusing),
+            or None for as_needed/monthly tasks.
         """
+        today = date.today()
         self.completed = True
-        self.last_completed = date.today()
+        self.last_completed = today
         
         # Only auto-create new instances for DAILY and WEEKLY tasks
-        if self.frequency == Frequency.DAILY:
-            next_date = date.today() + timedelta(days=1)
-            return self._create_next_instance(next_date)
-        elif self.frequency == Frequency.WEEKLY:
-            next_date = date.today() + timedelta(weeks=1)
-            return self._create_next_instance(next_date)
-        else:
+        interval = _RECURRENCE_INTERVALS.get(self.frequency)
+        if interval is None:
             # AS_NEEDED and MONTHLY tasks don't auto-generate
             return None
+        next_date = today + interval
+        
+        if reuse:
+            self.completed = False
+            return self
+        return self._create_next_instance(next_date)
     
     def _create_next_instance(self, next_due_date: date) -> 'Task':
         """
@@ -82,9 +242,9 @@ class Task:
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Pet:
-    """Represents a pet owned by an owner."""
+    """Represents a pet owned by an owner. Pets compare and hash by identity."""
     name: str
     species: str
     tasks: List[Task] = field(default_factory=list)
@@ -93,30 +253,54 @@ class Pet:
         """Add a task to the pet's task list."""
         self.tasks.append(task)
     
+    def addTasks(self, tasks: Iterable[Task]) -> None:
+        """Add several tasks at once."""
+        self.tasks.extend(tasks)
+    
     def getTasks(self) -> List[Task]:
-        """Get all tasks for the pet."""
+        """Get all tasks for the pet. Returns the pet's own list (no copy); use addTask to add tasks."""
         return self.tasks
     
+    def getTasksByTime(self) -> List[Task]:
+        """Get all tasks for the pet in time order (untimed last, ties in insertion order)."""
+        return sorted(self.tasks, key=_time_key)
+    
+    def tasksAt(self, time: str) -> List[Task]:
+        """Get the tasks scheduled at an HH:MM time (e.g. "9:00" and "09:00" match the same tasks)."""
+        minutes = _parse_hhmm(time)
+        if minutes == _NO_TIME:
+            return []
+        return [task for task in self.tasks if task.time_minutes == minutes]
+    
     def getTasksByType(self, taskType: str) -> List[Task]:
         """Get tasks filtered by type."""
         return [task for task in self.tasks if task.taskType == taskType]
     
     def getTasksDueToday(self) -> List[Task]:
         """Get tasks that are due today."""
-        return [task for task in self.tasks if task.isDueToday()]
+        _refresh_today()
+        return self._collect_due_tasks()
+    
+    def _collect_due_tasks(self) -> List[Task]:
+        """
+        Get tasks due today in insertion order, assuming the shared today token is already fresh.
+        Each task reuses its cached verdict until its completion date or frequency changes.
+        """
+        return [task for task in self.tasks if task._is_due_cached()]
     
-    def complete_task(self, task: Task) -> Optional[Task]:
+    def complete_task(self, task: Task, reuse: bool = False) -> Optional[Task]:
         """
         Mark a task as complete and add the next occurrence if applicable.
         
         Args:
             task: The task to mark as complete.
+            reuse: Let a daily/weekly task serve as its own next occurrence (see Task.mark_complete).
         
         Returns:
-            The next Task instance if one was created, or None otherwise.
+            The next Task instance if one was created or reused, or None otherwise.
         """
-        next_task = task.mark_complete()
-        if next_task:
+        next_task = task.mark_complete(reuse)
+        if next_task is not None and next_task is not task:
             self.addTask(next_task)
         return next_task
 
@@ -124,6 +308,8 @@ class Pet:
 class Owner:
     """Represents a pet owner who manages multiple pets."""
     
+    __slots__ = ("name", "dailyTimeAval", "pets")
+    
     def __init__(self, name: str, dailyTimeAval: float):
         self.name = name
         self.dailyTimeAval = dailyTimeAval  # in minutes
@@ -137,6 +323,10 @@ class Owner:
         """Add a pet to the owner's list."""
         self.pets.append(pet)
     
+    def addPets(self, pets: Iterable[Pet]) -> None:
+        """Add several pets at once."""
+        self.pets.extend(pets)
+    
     def getPets(self) -> List[Pet]:
         """Get all pets owned by this owner."""
         return self.pets
@@ -148,19 +338,27 @@ class Owner:
             all_tasks.extend(pet.getTasks())
         return all_tasks
     
+    def getAllTasksByTime(self) -> List[Task]:
+        """Get all tasks across all pets in time order (untimed last, ties in pet then insertion order)."""
+        return sorted(self.getAllTasks(), key=_time_key)
+    
     def getTasksDueToday(self) -> List[tuple]:
         """Get all tasks due today, organized by pet. Returns list of (Pet, List[Task]) tuples."""
+        _refresh_today()  # one date lookup for the whole pass
+        return self._collect_due_tasks_by_pet()
+    
+    def _collect_due_tasks_by_pet(self) -> List[tuple]:
+        """Same as getTasksDueToday, assuming the shared today token is already fresh."""
         tasks_by_pet = []
         for pet in self.pets:
-            due_tasks = pet.getTasksDueToday()
+            due_tasks = pet._collect_due_tasks()
             if due_tasks:
                 tasks_by_pet.append((pet, due_tasks))
         return tasks_by_pet
     
     def getTasksByCompletionStatus(self, completed: bool) -> List[Task]:
         """Filter all tasks by completion status. Returns tasks that are completed or incomplete based on the parameter."""
-        all_tasks = self.getAllTasks()
-        return [task for task in all_tasks if task.completed == completed]
+        return [task for pet in self.pets for task in pet.tasks if task.completed == completed]
     
     def getTasksByPetName(self, pet_name: str) -> List[Task]:
         """Get all tasks for a pet by its name."""
@@ -173,57 +371,165 @@ class Owner:
 class Scheduler:
     """The "Brain" that retrieves, organizes, and manages tasks across pets."""
     
+    __slots__ = ("owner", "schedule", "_conflicts", "_conflict_buckets", "_heap", "_seq",
+                 "_plan_key", "_plan_result", "_plan_schedule", "_plan_buckets", "_plan_heap")
+    
     def __init__(self, owner: Owner):
         self.owner = owner
-        self.schedule: Dict[Pet, List[Task]] = {}
-        self.conflicts: List[str] = []  # Store conflict warnings
+        self.schedule: List[Tuple[Pet, List[Task]]] = []
+        self._conflicts: Optional[List[str]] = []  # Conflict warnings; None until formatted from the buckets
+        self._conflict_buckets: Dict[int, List[Tuple[Pet, Task]]] = {}  # minute of day -> scheduled (pet, task) pairs
+        # Min-heap of (minutes since midnight, insertion counter, task); the counter keeps equal times stable
+        self._heap: List[Tuple[int, int, Task]] = []
+        self._seq = 0
+        # Last plan and what it was computed from: (today version, available time, per-task state)
+        self._plan_key: Optional[tuple] = None
+        # Pristine copies of the plan's outputs, reinstalled on a cache hit
+        self._plan_result: List[tuple] = []
+        self._plan_schedule: List[Tuple[Pet, List[Task]]] = []
+        self._plan_buckets: Dict[int, List[Tuple[Pet, Task]]] = {}
+        self._plan_heap: List[Tuple[int, int, Task]] = []
     
-    def genDailyPlan(self) -> List[tuple]:
-        """Generate a daily plan for all pets based on owner availability. Returns list of (Pet, List[Task]) tuples."""
-        schedule_list = self.owner.getTasksDueToday()
+    def genDailyPlan(self, refresh: bool = False) -> List[tuple]:
+        """
+        Generate a daily plan for all pets based on owner availability. Returns list of (Pet, List[Task]) tuples.
+        The previous plan is reused until the date, the available time, or any task the plan reads
+        changes (see _plan_inputs), including direct field edits. Pass refresh=True to force a rebuild.
+        Each call returns its own copy of the plan and reinstalls the plan's schedule, conflicts and queue.
+        """
+        key = (_refresh_today(), self.owner.dailyTimeAval, self._plan_inputs())
+        if not refresh and key == self._plan_key:
+            # Reinstall the cached plan, undoing any edits made to the schedule or queue since
+            self.schedule = self._copy_plan(self._plan_schedule)
+            self._conflict_buckets = self._plan_buckets
+            self._conflicts = None
+            self._heap = list(self._plan_heap)
+            self._seq = len(self._heap)
+            return self._copy_plan(self._plan_result)
         
-        # Prioritize tasks for each pet
-        self.schedule = {}
-        for pet, tasks in schedule_list:
-            self.schedule[id(pet)] = (pet, self.prioritizeTasks(tasks))
+        schedule_list = self.owner._collect_due_tasks_by_pet()
         
-        # Detect conflicts after scheduling
-        self.conflicts = self.detectScheduleConflicts()
+        # Prioritize tasks for each pet
+        self.schedule = [(pet, self.prioritizeTasks(tasks)) for pet, tasks in schedule_list]
         
+        self._index_schedule()
+        self._plan_key = key
+        self._plan_result = self._copy_plan(schedule_list)
+        self._plan_schedule = self._copy_plan(self.schedule)
+        self._plan_buckets = self._conflict_buckets
+        self._plan_heap = list(self._heap)
         return schedule_list
     
+    @staticmethod
+    def _copy_plan(plan: List[Tuple[Pet, List[Task]]]) -> List[Tuple[Pet, List[Task]]]:
+        """Copy a list of (Pet, List[Task]) pairs down to the task lists, so callers can't edit the cached plan."""
+        return [(pet, list(tasks)) for pet, tasks in plan]
+    
+    def _plan_inputs(self) -> tuple:
+        """
+        Snapshot every task field genDailyPlan depends on, per pet in owner order. Pets and tasks
+        compare by identity, so this is a linear scan with no due-date checks or sorting.
+        """
+        return tuple([(pet, task, task.last_completed, task.frequency, task.duration, task.priority, task.time)
+                      for pet in self.owner.pets for task in pet.tasks])
+    
+    def _index_schedule(self) -> None:
+        """
+        Index the new schedule: bucket same-time tasks for conflict detection and load the
+        pop_next queue. Warning strings are only built if someone asks for them.
+        """
+        self._conflict_buckets, heap = self._sweep_schedule()
+        self._conflicts = None
+        heapq.heapify(heap)
+        self._heap = heap
+        self._seq = len(heap)
+    
+    def _sweep_schedule(self) -> Tuple[Dict[int, List[Tuple[Pet, Task]]], List[Tuple[int, int, Task]]]:
+        """
+        Single sweep over the schedule, grouping timed tasks by parsed minute of day (so "9:00"
+        and "09:00" land together) and listing (minutes, seq, task) queue entries for every task.
+        
+        Returns:
+            The minute-of-day buckets of (pet, task) pairs, and the unheapified queue entries.
+        """
+        buckets: Dict[int, List[Tuple[Pet, Task]]] = {}
+        entries: List[Tuple[int, int, Task]] = []
+        for pet, tasks in self.schedule:
+            for task in tasks:
+                minutes = task.time_minutes
+                if minutes != _NO_TIME:  # Only check tasks with valid scheduled times
+                    buckets.setdefault(minutes, []).append((pet, task))
+                entries.append((minutes, len(entries), task))
+        return buckets, entries
+    
     def prioritizeTasks(self, tasks: List[Task]) -> List[Task]:
-        """Prioritize tasks based on priority and constraints."""
-        # Sort by priority (highest first), then by duration (shortest first)
-        sorted_tasks = sorted(
-            tasks,
-            key=lambda t: (-t.priority, t.duration)
-        )
+        """
+        Pick the tasks that fit within the owner's available time, favouring priority strictly:
+        one task always outranks any number of lower-priority tasks. Solved as a 0/1 knapsack
+        (weight = duration), so a long task no longer blocks several shorter ones of the same
+        priority. Durations are measured in whole minutes, or in hundredths of a minute when any
+        of them is fractional.
         
-        # Check if tasks fit within owner's available time
-        total_duration = 0
-        scheduled_tasks = []
+        Returns:
+            The selected tasks ordered by priority (highest first), then duration (shortest first).
+        """
+        budget = self.owner.dailyTimeAval
+        if not tasks or budget < 0:
+            return []
+        
+        # Sort by priority (highest first), then by duration (shortest first).
+        # Items later in this order are only taken on a strict improvement,
+        # so ties favour higher-priority, shorter tasks.
+        ordered = sorted(tasks, key=attrgetter('duration'))
+        ordered.sort(key=attrgetter('priority'), reverse=True)
+        durations = [task.duration for task in ordered]
         
-        for task in sorted_tasks:
-            if total_duration + task.duration <= self.owner.dailyTimeAval:
-                scheduled_tasks.append(task)
-                total_duration += task.duration
+        # Common case: everything fits, so there is nothing to choose between
+        if sum(durations) <= budget:
+            return ordered
         
-        return scheduled_tasks
+        # Durations round up and the budget rounds down, so a selection never exceeds the real budget;
+        # durations with up to two decimals (10.1, 15.25) are represented exactly. The round() absorbs
+        # float noise such as 0.29 * 100 == 28.999999999999996 before ceil/floor.
+        scale = 1 if all(float(d).is_integer() for d in durations) else _FRACTIONAL_SCALE
+        weights = [math.ceil(round(d * scale, 6)) for d in durations]
+        capacity = math.floor(round(budget * scale, 6))
+        # (n + 1) ** priority exceeds the combined value of all n tasks at lower priorities,
+        # so the DP never trades a higher-priority task for a pile of lower-priority ones
+        base = len(ordered) + 1
+        values = [base ** task.priority for task in ordered]
+        selected = _knapsack(weights, values, capacity)
+        return [task for task, keep in zip(ordered, selected) if keep]
     
     def sortByTime(self, tasks: List[Task]) -> List[Task]:
-        """Sort tasks chronologically by scheduled time in HH:MM format."""
-        def parse_time(time_str: str) -> int:
-            """Convert HH:MM format to minutes since midnight for sorting."""
-            if not time_str:
-                return float('inf')  # Tasks without time go to the end
-            try:
-                hours, minutes = map(int, time_str.split(':'))
-                return hours * 60 + minutes
-            except (ValueError, AttributeError):
-                return float('inf')
-        
-        return sorted(tasks, key=lambda t: parse_time(t.time))
+        """
+        Sort tasks chronologically by scheduled time in HH:MM format.
+        Uses the minutes parsed from each task's time, re-parsed only after time is reassigned;
+        tasks without a valid time go to the end.
+        """
+        # The key is computed once per task (one time_minutes property call, which only parses
+        # if time was reassigned) and compared as plain ints; timsort is stable and linear on
+        # input that is already in time order
+        return sorted(tasks, key=_time_key)
+    
+    def queue_by_time(self, tasks: List[Task]) -> None:
+        """Add tasks to the time-ordered queue consumed by pop_next."""
+        heap = self._heap
+        seq = self._seq
+        for task in tasks:
+            heap.append((task.time_minutes, seq, task))
+            seq += 1
+        self._seq = seq
+        heapq.heapify(heap)
+    
+    def pop_next(self) -> Optional[Task]:
+        """
+        Remove and return the earliest queued task, or None when the queue is empty.
+        Tasks with the same time come out in the order they were queued; untimed tasks come last.
+        """
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
     
     def detectScheduleConflicts(self) -> List[str]:
         """
@@ -233,67 +539,74 @@ class Scheduler:
         Returns:
             A list of warning messages describing detected conflicts.
         """
-        warnings = []
-        
-        # Build a map of time -> [(pet_name, task_name), ...]
-        time_map: Dict[str, List[Tuple[str, str]]] = {}
-        
-        for pet_id, (pet, tasks) in self.schedule.items():
-            for task in tasks:
-                if task.time:  # Only check tasks with scheduled times
-                    if task.time not in time_map:
-                        time_map[task.time] = []
-                    time_map[task.time].append((pet.name, task.name))
-        
-        # Check for conflicts (multiple tasks at same time)
-        for scheduled_time, task_list in time_map.items():
-            if len(task_list) > 1:
-                # Build warning message
-                task_details = ", ".join([f"{task_name} ({pet_name})" for pet_name, task_name in task_list])
-                warning = f"⚠️  Conflict at {scheduled_time}: {task_details}"
-                warnings.append(warning)
-        
-        return warnings
+        self._conflict_buckets, _ = self._sweep_schedule()
+        self._conflicts = None  # cached warnings describe the old buckets
+        return self._format_conflicts()
+    
+    def _format_conflicts(self) -> List[str]:
+        """Build warnings for buckets holding more than one task, in time order."""
+        buckets = self._conflict_buckets
+        return [self._format_conflict(minutes, buckets[minutes])
+                for minutes in sorted(m for m, items in buckets.items() if len(items) > 1)]
+    
+    @staticmethod
+    def _format_conflict(minutes: int, items: List[Tuple[Pet, Task]]) -> str:
+        """Build the warning message for tasks sharing one scheduled time."""
+        task_details = ", ".join([f"{task.name} ({pet.name})" for pet, task in items])
+        return f"⚠️  Conflict at {minutes // 60:02d}:{minutes % 60:02d}: {task_details}"
     
     def getConflictWarnings(self) -> List[str]:
-        """Return the list of conflict warnings from the last generated plan."""
-        return self.conflicts
+        """
+        Return the list of conflict warnings from the last generated plan.
+        The messages are built on the first call after genDailyPlan and reused afterwards.
+        """
+        if self._conflicts is None:
+            self._conflicts = self._format_conflicts()
+        return self._conflicts
+    
+    @property
+    def conflicts(self) -> List[str]:
+        """Conflict warnings from the last generated plan (see getConflictWarnings)."""
+        return self.getConflictWarnings()
+    
+    @conflicts.setter
+    def conflicts(self, warnings: List[str]) -> None:
+        self._conflicts = warnings
     
     def explainPlan(self) -> str:
         """Explain the generated daily plan, including any scheduling conflicts."""
         if not self.schedule:
             return "No tasks scheduled for today."
         
-        explanation = f"Daily Plan for {self.owner.name}:\n"
-        explanation += f"Available time: {self.owner.dailyTimeAval} minutes\n\n"
+        parts: List[str] = []
+        append = parts.append
+        append(f"Daily Plan for {self.owner.name}:\n")
+        append(f"Available time: {self.owner.dailyTimeAval} minutes\n\n")
         
-        total_time = 0
-        for pet_id, (pet, tasks) in self.schedule.items():
-            explanation += f"{pet.name} ({pet.species}):\n"
-            for task in tasks:
-                explanation += f"  - {task.name} ({task.duration} min) [Priority: {task.priority}]"
-                if task.time:
-                    explanation += f" @ {task.time}"
-                explanation += "\n"
-                total_time += task.duration
-            explanation += "\n"
+        for pet, tasks in self.schedule:
+            # One joined chunk per pet: header, task lines and the trailing blank line
+            append("".join([
+                f"{pet.name} ({pet.species}):\n",
+                *[f"  - {t.name} ({t.duration} min) [Priority: {t.priority}]{f' @ {t.time}' if t.time else ''}\n"
+                  for t in tasks],
+                "\n",
+            ]))
         
-        explanation += f"Total time needed: {total_time} minutes\n"
+        total_time = sum(task.duration for _, tasks in self.schedule for task in tasks)
+        append(f"Total time needed: {total_time} minutes\n")
         
         # Add conflict warnings if any exist
-        if self.conflicts:
-            explanation += "\n" + "=" * 50 + "\n"
-            explanation += "SCHEDULING CONFLICTS DETECTED:\n"
-            explanation += "=" * 50 + "\n"
-            for warning in self.conflicts:
-                explanation += warning + "\n"
-            explanation += "Please review and reschedule conflicting tasks.\n"
+        conflicts = self.getConflictWarnings()
+        if conflicts:
+            append("\n" + "=" * 50 + "\n")
+            append("SCHEDULING CONFLICTS DETECTED:\n")
+            append("=" * 50 + "\n")
+            for warning in conflicts:
+                append(warning + "\n")
+            append("Please review and reschedule conflicting tasks.\n")
         
-        return explanation
+        return "".join(parts)
     
     def getScheduledTasksByCompletionStatus(self, completed: bool) -> List[Task]:
         """Filter scheduled tasks by completion status."""
-        scheduled_tasks = []
-        for pet_id, (pet, tasks) in self.schedule.items():
-            scheduled_tasks.extend([task for task in tasks if task.completed == completed])
-        return scheduled_tasks
+        return [task for _, tasks in self.schedule for task in tasks if task.completed == completed]
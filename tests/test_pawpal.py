@@ -1,5 +1,5 @@
 import pytest
-from datetime import date, timedelta
+from datetime import date, timedelta, time as dt_time
 from pawpal_system import Task, Pet, Owner, Scheduler, Frequency
 
 # ==================== EXISTING TESTS ====================
@@ -50,6 +50,13 @@ class TestRecurringTaskLogic:
                    frequency=Frequency.DAILY, last_completed=yesterday)
         assert task.isDueToday() is True
     
+    def test_is_due_against_explicit_date(self):
+        """isDueToday(today=...) should evaluate against the given date."""
+        task = Task(name="Feed", duration=5.0, priority=3, taskType="feeding",
+                   frequency=Frequency.DAILY, last_completed=date.today())
+        assert task.isDueToday(today=date.today()) is False
+        assert task.isDueToday(today=date.today() + timedelta(days=1)) is True
+
     def test_weekly_task_never_completed_is_due(self):
         """Weekly task with no completion history should be due."""
         task = Task(name="Bath", duration=30.0, priority=2, taskType="grooming",
@@ -83,6 +90,14 @@ class TestRecurringTaskLogic:
                    frequency=Frequency.MONTHLY, last_completed=earlier_this_month)
         assert task.isDueToday() is False
     
+    def test_monthly_task_same_month_last_year_is_due(self):
+        """Monthly task completed in this calendar month a year ago should be due."""
+        today = date.today()
+        last_year = today.replace(year=today.year - 1, day=1)
+        task = Task(name="Vet", duration=60.0, priority=5, taskType="health",
+                   frequency=Frequency.MONTHLY, last_completed=last_year)
+        assert task.isDueToday() is True
+
     def test_as_needed_always_due(self):
         """AS_NEEDED tasks should always be due."""
         task = Task(name="Emergency", duration=15.0, priority=5, taskType="emergency",
@@ -157,6 +172,39 @@ class TestRecurringTaskLogic:
         assert pet.getTasks()[-1].name == "Feed"
         assert pet.getTasks()[-1].completed is False
 
+    def test_complete_task_reuse_keeps_single_instance(self):
+        """With reuse=True, a daily task becomes its own next occurrence."""
+        pet = Pet(name="Buddy", species="dog")
+        task = Task(name="Feed", duration=5.0, priority=3, taskType="feeding",
+                   frequency=Frequency.DAILY)
+        pet.addTask(task)
+
+        next_task = pet.complete_task(task, reuse=True)
+
+        assert next_task is task
+        assert len(pet.getTasks()) == 1
+        assert task.completed is False
+        assert task.last_completed == date.today()
+        assert task.isDueToday() is False
+
+    def test_due_today_refreshes_after_completion(self):
+        """A cached due-today verdict should not survive marking the task complete."""
+        task = Task(name="Feed", duration=5.0, priority=3, taskType="feeding",
+                   frequency=Frequency.DAILY)
+
+        assert task.isDueToday() is True
+        task.mark_complete()
+        assert task.isDueToday() is False
+
+    def test_due_today_refreshes_after_frequency_change(self):
+        """Changing a task's frequency should not reuse the old due-today verdict."""
+        task = Task(name="Vet", duration=60.0, priority=5, taskType="health",
+                   frequency=Frequency.MONTHLY, last_completed=date.today())
+
+        assert task.isDueToday() is False
+        task.frequency = Frequency.AS_NEEDED
+        assert task.isDueToday() is True
+
 
 # ==================== SORTING CORRECTNESS ====================
 
@@ -268,6 +316,61 @@ class TestTaskSorting:
         assert sorted_tasks[1].name == "Feed_B"
         assert sorted_tasks[2].name == "Feed_C"
 
+    def test_all_tasks_by_time_merges_pets(self):
+        """Owner.getAllTasksByTime should interleave every pet's tasks chronologically."""
+        owner = Owner("John", 480)
+        dog = Pet(name="Buddy", species="dog")
+        cat = Pet(name="Whiskers", species="cat")
+        dog.addTask(Task(name="Dog Dinner", duration=10.0, priority=3, taskType="feeding", time="18:00"))
+        dog.addTask(Task(name="Dog Breakfast", duration=5.0, priority=3, taskType="feeding", time="07:00"))
+        cat.addTask(Task(name="Brush", duration=10.0, priority=2, taskType="grooming"))
+        cat.addTask(Task(name="Cat Breakfast", duration=5.0, priority=3, taskType="feeding", time="08:00"))
+        owner.addPet(dog)
+        owner.addPet(cat)
+
+        names = [t.name for t in owner.getAllTasksByTime()]
+
+        assert names == ["Dog Breakfast", "Cat Breakfast", "Dog Dinner", "Brush"]
+        assert [t.name for t in dog.getTasks()] == ["Dog Dinner", "Dog Breakfast"]
+
+    def test_reassigned_time_is_reparsed(self):
+        """Changing task.time after creation should move the task in every time-ordered view."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+        pet = Pet(name="Buddy", species="dog")
+        walk = Task(name="Walk", duration=20.0, priority=3, taskType="exercise", time="18:00")
+        feed = Task(name="Feed", duration=5.0, priority=3, taskType="feeding", time="08:00")
+        pet.addTask(walk)
+        pet.addTask(feed)
+        owner.addPet(pet)
+
+        walk.time = "07:00"
+
+        assert [t.name for t in scheduler.sortByTime([feed, walk])] == ["Walk", "Feed"]
+        assert [t.name for t in pet.getTasksByTime()] == ["Walk", "Feed"]
+        assert pet.tasksAt("07:00") == [walk]
+        assert pet.tasksAt("18:00") == []
+        scheduler.genDailyPlan()
+        assert scheduler.pop_next() is walk
+
+    def test_pop_next_yields_plan_in_time_order(self):
+        """pop_next should hand out scheduled tasks earliest first, untimed last."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Dinner", duration=10.0, priority=3, taskType="feeding", time="18:00"))
+        pet.addTask(Task(name="Brush", duration=10.0, priority=3, taskType="grooming"))
+        pet.addTask(Task(name="Breakfast", duration=5.0, priority=3, taskType="feeding", time="08:00"))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+        order = []
+        while (task := scheduler.pop_next()) is not None:
+            order.append(task.name)
+
+        assert order == ["Breakfast", "Dinner", "Brush"]
+
 
 # ==================== CONFLICT DETECTION ====================
 
@@ -384,6 +487,70 @@ class TestConflictDetection:
         
         assert len(warnings) == 0
     
+    def test_conflict_detected_across_time_spellings(self):
+        """'9:00' and '09:00' are the same time and should be flagged."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="9:00"))
+        pet.addTask(Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="09:00"))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+        warnings = scheduler.getConflictWarnings()
+
+        assert len(warnings) == 1
+        assert "09:00" in warnings[0]
+
+    def test_pet_tasks_at_time(self):
+        """Pet.tasksAt should return every task at that time and nothing else."""
+        pet = Pet(name="Buddy", species="dog")
+        task1 = Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00")
+        task2 = Task(name="Medication", duration=2.0, priority=5, taskType="health", time="09:00")
+        task3 = Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="14:00")
+        pet.addTask(task1)
+        pet.addTask(task2)
+        pet.addTask(task3)
+
+        assert list(pet.tasksAt("9:00")) == [task1, task2]
+        assert len(pet.tasksAt("12:00")) == 0
+
+    def test_detect_conflicts_refreshes_cached_warnings(self):
+        """Re-running detectScheduleConflicts after the schedule changes should update getConflictWarnings."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+        pet = Pet(name="Buddy", species="dog")
+        feed = Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00")
+        walk = Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="09:00")
+        pet.addTask(feed)
+        pet.addTask(walk)
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+        assert len(scheduler.getConflictWarnings()) == 1
+
+        scheduler.schedule = [(pet, [feed])]
+
+        assert scheduler.detectScheduleConflicts() == []
+        assert scheduler.getConflictWarnings() == []
+
+    def test_conflicts_attribute_can_be_reset(self):
+        """Assigning scheduler.conflicts should replace the reported warnings."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00"))
+        pet.addTask(Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="09:00"))
+        owner.addPet(pet)
+        scheduler.genDailyPlan()
+        assert len(scheduler.conflicts) == 1
+
+        scheduler.conflicts = []
+
+        assert scheduler.conflicts == []
+        assert "SCHEDULING CONFLICTS" not in scheduler.explainPlan()
+
     def test_conflict_warning_format(self):
         """Conflict warnings should include pet names and task names."""
         owner = Owner("John", 480)
@@ -493,6 +660,41 @@ class TestTaskPrioritization:
         total_duration = sum(t.duration for t in scheduled)
         assert total_duration == 50
 
+    def test_long_task_does_not_block_equal_priority_pair(self):
+        """Two shorter tasks should beat one long task of the same priority."""
+        owner = Owner("John", 62)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        task1 = Task(name="Long Hike", duration=60.0, priority=5, taskType="exercise")
+        task2 = Task(name="Feed", duration=31.0, priority=5, taskType="feeding")
+        task3 = Task(name="Brush", duration=31.0, priority=5, taskType="grooming")
+
+        pet.addTask(task1)
+        pet.addTask(task2)
+        pet.addTask(task3)
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+        scheduled = scheduler.getScheduledTasksByCompletionStatus(False)
+
+        assert sorted(t.name for t in scheduled) == ["Brush", "Feed"]
+
+    def test_many_low_priority_tasks_do_not_outweigh_one_high_priority(self):
+        """One higher-priority task should win over any number of lower-priority ones."""
+        owner = Owner("John", 10)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Medication", duration=10.0, priority=5, taskType="health"))
+        for i, duration in enumerate([1.0, 1.0, 1.5, 1.5, 1.0, 1.5]):
+            pet.addTask(Task(name=f"Treat {i}", duration=duration, priority=1, taskType="reward"))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+
+        assert [t.name for t in scheduler.getScheduledTasksByCompletionStatus(False)] == ["Medication"]
+
 
 # ==================== DATA INTEGRITY ====================
 
@@ -548,9 +750,86 @@ class TestDataIntegrity:
         
         scheduler.genDailyPlan()
         scheduled = scheduler.getScheduledTasksByCompletionStatus(False)
-        
+
         assert len(scheduled) == 2
 
+    def test_fractional_durations_never_exceed_available_time(self):
+        """Rounding fractional durations must not let the plan overrun the budget."""
+        owner = Owner("John", 30.5)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Walk A", duration=15.4, priority=3, taskType="exercise"))
+        pet.addTask(Task(name="Walk B", duration=15.4, priority=3, taskType="exercise"))
+        pet.addTask(Task(name="Treat", duration=1.0, priority=1, taskType="reward"))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+        scheduled = scheduler.getScheduledTasksByCompletionStatus(False)
+
+        assert sum(t.duration for t in scheduled) <= 30.5
+        assert len(scheduled) == 2
+
+    def test_fractional_durations_that_fit_exactly_are_kept(self):
+        """Tasks whose decimal durations add up to exactly the budget should all be scheduled."""
+        owner = Owner("John", 20)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Walk", duration=10.1, priority=5, taskType="exercise"))
+        pet.addTask(Task(name="Meds", duration=9.9, priority=5, taskType="health"))
+        pet.addTask(Task(name="Treat", duration=5.0, priority=1, taskType="reward"))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+
+        assert [t.name for t in scheduler.getScheduledTasksByCompletionStatus(False)] == ["Meds", "Walk"]
+
+    def test_selection_does_not_depend_on_decimal_places(self):
+        """A long decimal duration should be budgeted the same way as a short one."""
+        selections = []
+        for vet_duration in (63.5, 63.3333):
+            scheduler = Scheduler(Owner("John", 100))
+            tasks = [
+                Task(name="Vet", duration=vet_duration, priority=5, taskType="health"),
+                Task(name="Walk", duration=39.0, priority=4, taskType="exercise"),
+                Task(name="Groom", duration=39.5, priority=4, taskType="grooming"),
+            ]
+            selected = scheduler.prioritizeTasks(tasks)
+            assert sum(t.duration for t in selected) <= 100
+            selections.append([t.name for t in selected])
+
+        assert selections[0] == selections[1]
+
+    def test_all_tasks_reflects_tasks_added_after_first_read(self):
+        """Owner.getAllTasks should pick up tasks added after a previous call."""
+        owner = Owner("John", 480)
+        pet = Pet(name="Buddy", species="dog")
+        owner.addPet(pet)
+        pet.addTask(Task(name="Feed", duration=5.0, priority=3, taskType="feeding"))
+
+        assert len(owner.getAllTasks()) == 1
+        pet.addTask(Task(name="Walk", duration=30.0, priority=4, taskType="exercise"))
+        assert [t.name for t in owner.getAllTasks()] == ["Feed", "Walk"]
+
+    def test_shared_pet_updates_every_owner(self):
+        """A pet added to two owners should show up-to-date tasks for both, including direct list edits."""
+        first = Owner("John", 480)
+        second = Owner("Jane", 480)
+        pet = Pet(name="Buddy", species="dog")
+        first.addPet(pet)
+        second.addPet(pet)
+        assert first.getAllTasks() == [] and second.getAllTasks() == []
+
+        pet.addTask(Task(name="Feed", duration=5.0, priority=3, taskType="feeding"))
+        first.getAllTasks().clear()
+
+        assert [t.name for t in first.getAllTasks()] == ["Feed"]
+        assert [t.name for t in second.getAllTasks()] == ["Feed"]
+
+        pet.getTasks().append(Task(name="Walk", duration=30.0, priority=4, taskType="exercise"))
+        assert [t.name for t in first.getAllTasks()] == ["Feed", "Walk"]
+
 
 # ==================== MULTI-PET SCENARIOS ====================
 
@@ -580,6 +859,27 @@ class TestMultiPetScheduling:
         assert len(warnings) == 1
         assert "Buddy" in warnings[0] and "Whiskers" in warnings[0]
     
+    def test_bulk_add_pets_and_tasks(self):
+        """addPets/addTasks should behave like repeated addPet/addTask calls."""
+        owner = Owner("John", 480)
+        pet1 = Pet(name="Buddy", species="dog")
+        pet2 = Pet(name="Whiskers", species="cat")
+        owner.addPets([pet1, pet2])
+
+        walk = Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="14:00")
+        feed = Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00")
+        pet1.addTasks([walk, feed])
+        pet2.addTasks([Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00")])
+
+        assert owner.getPets() == [pet1, pet2]
+        assert pet1.getTasks() == [walk, feed]
+        assert pet1.getTasksByTime() == [feed, walk]
+        assert len(owner.getAllTasks()) == 3
+
+        scheduler = Scheduler(owner)
+        scheduler.genDailyPlan()
+        assert len(scheduler.getConflictWarnings()) == 1
+
     def test_pet_with_no_tasks_not_in_plan(self):
         """Pets with no tasks should not appear in the daily plan."""
         owner = Owner("John", 480)
@@ -610,6 +910,76 @@ class TestMultiPetScheduling:
         
         assert len(plan) == 0
     
+    def test_plan_regenerates_only_after_changes(self):
+        """genDailyPlan should reuse its plan until tasks, time or completions change."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+
+        pet = Pet(name="Buddy", species="dog")
+        feed = Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00")
+        pet.addTask(feed)
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+        cached = scheduler._plan_result
+        scheduler.genDailyPlan()
+        assert scheduler._plan_result is cached
+
+        pet.addTask(Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="09:00"))
+        assert len(scheduler.genDailyPlan()[0][1]) == 2
+        assert len(scheduler.getConflictWarnings()) == 1
+
+        feed.mark_complete()
+        assert [t.name for t in scheduler.genDailyPlan()[0][1]] == ["Walk"]
+        assert len(scheduler.getConflictWarnings()) == 0
+
+        owner.updateTimeAval(10)
+        scheduler.genDailyPlan()
+        assert scheduler.getScheduledTasksByCompletionStatus(False) == []
+
+    def test_plan_notices_direct_task_edits_only_for_its_owner(self):
+        """Assigning task fields directly should invalidate the plan; other owners' tasks should not."""
+        owner = Owner("John", 480)
+        other = Owner("Jane", 480)
+        scheduler = Scheduler(owner)
+        pet = Pet(name="Buddy", species="dog")
+        other_pet = Pet(name="Whiskers", species="cat")
+        feed = Task(name="Feed", duration=5.0, priority=5, taskType="feeding")
+        brush = Task(name="Brush", duration=10.0, priority=2, taskType="grooming")
+        pet.addTask(feed)
+        other_pet.addTask(brush)
+        owner.addPet(pet)
+        other.addPet(other_pet)
+
+        scheduler.genDailyPlan()
+        cached = scheduler._plan_result
+        other_pet.complete_task(brush)
+        scheduler.genDailyPlan()
+        assert scheduler._plan_result is cached
+
+        feed.last_completed = date.today()
+        assert scheduler.genDailyPlan() == []
+
+    def test_cached_plan_is_not_affected_by_caller_edits(self):
+        """Editing a returned plan or the schedule should not leak into the next cached plan."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Feed", duration=5.0, priority=5, taskType="feeding", time="09:00"))
+        pet.addTask(Task(name="Walk", duration=30.0, priority=4, taskType="exercise", time="09:00"))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan().clear()
+        assert len(scheduler.genDailyPlan()) == 1
+
+        scheduler.schedule = []
+        scheduler.detectScheduleConflicts()
+        plan = scheduler.genDailyPlan()
+
+        assert [t.name for t in plan[0][1]] == ["Feed", "Walk"]
+        assert "Feed" in scheduler.explainPlan()
+        assert len(scheduler.getConflictWarnings()) == 1
+
     def test_explain_plan_empty_schedule(self):
         """explainPlan should handle empty schedule gracefully."""
         owner = Owner("John", 480)
@@ -617,4 +987,16 @@ class TestMultiPetScheduling:
         
         explanation = scheduler.explainPlan()
         
-        assert "No tasks scheduled for today" in explanation
\ No newline at end of file
+        assert "No tasks scheduled for today" in explanation
+
+    def test_explain_plan_accepts_non_string_time(self):
+        """explainPlan should format a time that is not a string instead of raising."""
+        owner = Owner("John", 480)
+        scheduler = Scheduler(owner)
+        pet = Pet(name="Buddy", species="dog")
+        pet.addTask(Task(name="Feed", duration=5.0, priority=3, taskType="feeding", time=dt_time(9, 0)))
+        owner.addPet(pet)
+
+        scheduler.genDailyPlan()
+
+        assert "Feed (5.0 min) [Priority: 3] @ 09:00:00" in scheduler.explainPlan()